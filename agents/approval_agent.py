@@ -13,9 +13,15 @@ LangGraph workflow.
 
 from __future__ import annotations
 
-from typing import Dict
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple
 
-from langchain_core.runnables import RunnableLambda
+if TYPE_CHECKING:
+    import numpy as np
+    from langchain_core.runnables import RunnableLambda
+
+# Upper bound on cached decisions per agent; the cache is reset when full.
+_DECISION_CACHE_SIZE = 1024
 
 
 class ApprovalAgent:
@@ -23,27 +29,72 @@ class ApprovalAgent:
 
     Public API:
       - `decide(quantity)`: Returns a dict with `approved: bool` and `reason: str`.
+      - `decide_batch(quantities)`: Returns a boolean NumPy array of approvals.
 
     Also exposes `runnable` (a RunnableLambda) for use in chains/graphs.
     """
 
     def __init__(self, max_auto_approve_quantity: int = 5) -> None:
+        # Decisions by integer quantity. A plain dict of tuples keeps the
+        # agent free of reference cycles, unlike an lru_cache on a bound method.
+        self._decisions: Dict[int, Tuple[bool, str]] = {}
         self.max_auto_approve_quantity = max_auto_approve_quantity
-        self.runnable = RunnableLambda(self._decide_to_dict)
+
+    @property
+    def max_auto_approve_quantity(self) -> int:
+        return self._max_auto_approve_quantity
+
+    @max_auto_approve_quantity.setter
+    def max_auto_approve_quantity(self, value: int) -> None:
+        self._max_auto_approve_quantity = value
+        # Reason strings only vary by quantity, so render the threshold part
+        # once per threshold rather than on every decision.
+        self._approve_template = f"Quantity {{q}} is within auto-approval threshold (<= {value})."
+        self._deny_template = f"Quantity {{q}} exceeds auto-approval threshold (> {value})."
+        # Cached decisions were made against the previous threshold.
+        self._decisions.clear()
+
+    @cached_property
+    def runnable(self) -> RunnableLambda:
+        """Decision function wrapped as a LangChain Runnable, built on first access."""
+        # Deferred import: `decide` alone needs nothing from LangChain.
+        from langchain_core.runnables import RunnableLambda
+
+        return RunnableLambda(self._decide_to_dict)
 
     def decide(self, quantity: int) -> Dict[str, object]:
         return self._decide_to_dict(quantity)
 
+    def decide_batch(self, quantities: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Approve many quantities at once (e.g. bulk purchase orders).
+
+        The threshold check is a single vectorized NumPy comparison, so the
+        per-item Python loop disappears. Quantities keep their own dtype (no
+        integer cast), so fractional values are judged exactly as `decide`
+        would judge them. NumPy is imported on first use and is only required
+        by callers of this method.
+        """
+        import numpy as np
+
+        return np.asarray(quantities) <= self.max_auto_approve_quantity
+
     def _decide_to_dict(self, quantity: int) -> Dict[str, object]:
-        if quantity <= self.max_auto_approve_quantity:
-            return {
-                "approved": True,
-                "reason": f"Quantity {quantity} is within auto-approval threshold (<= {self.max_auto_approve_quantity}).",
-            }
-        return {
-            "approved": False,
-            "reason": f"Quantity {quantity} exceeds auto-approval threshold (> {self.max_auto_approve_quantity}).",
-        }
+        # Only plain ints are cached, so e.g. 5.0 is not served the reason for 5.
+        if type(quantity) is not int:
+            approved, reason = self._decision(quantity)
+        else:
+            decision = self._decisions.get(quantity)
+            if decision is None:
+                if len(self._decisions) >= _DECISION_CACHE_SIZE:
+                    self._decisions.clear()
+                decision = self._decisions[quantity] = self._decision(quantity)
+            approved, reason = decision
+        return {"approved": approved, "reason": reason}
+
+    def _decision(self, quantity: int) -> Tuple[bool, str]:
+        approved = quantity <= self.max_auto_approve_quantity
+        template = self._approve_template if approved else self._deny_template
+        return approved, template.replace("{q}", str(quantity))
 
 
 __all__ = ["ApprovalAgent"]
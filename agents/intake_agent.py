@@ -20,16 +20,20 @@ Example
 
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
-from typing import Dict, Optional
+import string
+from functools import cached_property, lru_cache
+from itertools import groupby
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional
 
-from langchain_core.runnables import RunnableLambda
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableLambda
 
+# Common verbs like order/buy/purchase that are dropped from the item name.
+_VERBS = frozenset({"order", "buy", "purchase", "get", "acquire", "request"})
 
-@dataclass
-class IntakeResult:
-    """Structured result produced by the `IntakeAgent`.
+
+class IntakeResult(NamedTuple):
+    """Structured, immutable result produced by the `IntakeAgent`.
 
     Attributes:
         item: Normalized item noun (lowercase, plural form if applicable)
@@ -46,18 +50,27 @@ class IntakeAgent:
     """Parses a natural language procurement request into structured data.
 
     The agent exposes a `runnable` compatible with LangChain's LCEL to allow
-    composition inside larger chains or graphs. Internally, it uses a simple
-    regex and some light normalization rules:
-
-    - Quantity: the first integer it finds (defaults to 1 if none found)
-    - Item: the remaining non-numeric words, normalized to lowercase
+    composition inside larger chains or graphs. Internally, it makes a single
+    pass over the whitespace-separated words with some light normalization rules:
+
+    - Quantity: the first run of digits it finds, even inside a word such as
+      "30x" or "(7)" (defaults to 1 if none found)
+    - Item: the remaining non-verb words with digits removed, normalized to
+      lowercase. Punctuation is stripped from the edges of every word before
+      the verb check, so "Order:" and "Order," are both dropped as verbs and
+      "chairs." becomes "chairs"; punctuation inside a word ("re-order",
+      "t-shirt") is kept and the word stays whole.
     - Basic plural handling: if quantity == 1, keep singular; otherwise, keep
       as-is (we do not attempt sophisticated lemmatization for simplicity).
     """
 
-    def __init__(self) -> None:
-        # Expose the parsing function as a LangChain Runnable for easy wiring.
-        self.runnable = RunnableLambda(self._parse_to_dict)
+    @cached_property
+    def runnable(self) -> RunnableLambda:
+        """Parsing function wrapped as a LangChain Runnable, built on first access."""
+        # Imported lazily so plain method calls never load LangChain runnables.
+        from langchain_core.runnables import RunnableLambda
+
+        return RunnableLambda(self._parse_to_dict)
 
     # Public API -----------------------------------------------------------
     def parse_request(self, request: str) -> Dict[str, object]:
@@ -73,36 +86,43 @@ class IntakeAgent:
 
     # Internal helpers -----------------------------------------------------
     def _parse_to_dict(self, request: str) -> Dict[str, object]:
-        quantity = self._extract_quantity(request)
-        item = self._extract_item(request, quantity)
-        result = IntakeResult(item=item, quantity=quantity, raw_request=request)
+        # Callers may mutate the result, so build a fresh dict from the cache.
+        item, quantity, raw_request = self._parse(request)
         return {
-            "item": result.item,
-            "quantity": result.quantity,
-            "raw_request": result.raw_request,
+            "item": item,
+            "quantity": quantity,
+            "raw_request": raw_request,
         }
 
-    def _extract_quantity(self, request: str) -> int:
-        match = re.search(r"(\d+)", request)
-        if match:
-            try:
-                return int(match.group(1))
-            except ValueError:
-                pass
-        return 1
-
-    def _extract_item(self, request: str, quantity: Optional[int]) -> str:
-        # Remove numbers and common verbs like order/buy/purchase
-        cleaned = re.sub(r"\d+", " ", request, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\b(order|buy|purchase|get|acquire|request)\b", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip().lower()
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse(request: str) -> IntakeResult:
+        # Parsing is pure, so repeated requests are served from the cache.
+        quantity: Optional[int] = None
+        words = []
+        for token in request.split():
+            # Split each word into digit and non-digit runs, so "30x", "(7)"
+            # and "Order3laptops" still yield their number.
+            for is_digit, run in groupby(token.lower(), str.isdecimal):
+                word = "".join(run)
+                if is_digit:
+                    # Numbers never belong to the item; the first one is the quantity.
+                    if quantity is None:
+                        quantity = int(word)
+                    continue
+                word = word.strip(string.punctuation)
+                if word and word not in _VERBS:
+                    words.append(word)
+        if quantity is None:
+            quantity = 1
+        item = " ".join(words)
 
         # A very naive singular-plural normalization: if quantity == 1, try singular.
         # This is intentionally simple for demo purposes.
         if (quantity or 1) == 1:
-            if cleaned.endswith("s") and not cleaned.endswith("ss"):
-                cleaned = cleaned[:-1]
-        return cleaned
+            if item.endswith("s") and not item.endswith("ss"):
+                item = item[:-1]
+        return IntakeResult(item=item, quantity=quantity, raw_request=request)
 
 
 __all__ = ["IntakeAgent", "IntakeResult"]
@@ -16,11 +16,52 @@ Example
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
-from langchain_core.runnables import RunnableLambda
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableLambda
+
+
+def _normalize(text: str) -> str:
+    # Lowercase and drop a naive plural "s" (but not "ss", e.g. "glass")
+    text = text.strip().lower()
+    if text.endswith("s") and not text.endswith("ss"):
+        return text[:-1]
+    return text
+
+
+def _alt_normalize(text: str) -> str:
+    # Toggle simple plural form for a second chance match
+    if text.endswith("s") and not text.endswith("ss"):
+        return text[:-1]
+    return f"{text}s"
+
+
+def _build_index(item_to_supplier: Dict[str, str]) -> Dict[str, str]:
+    """Map every lowercase spelling that matches a key to its supplier.
+
+    Matching normalizes the query to singular and, failing that, retries with
+    the plural/singular form toggled. Only a handful of spellings around each
+    key can match this way, so they are resolved once here and a lookup is a
+    single `dict.get` on the lowercased query. On collisions the original key
+    still wins, exactly as with the two-step match.
+    """
+    # Normalize keys to lowercase singular for lookup simplicity
+    mapping = {_normalize(k): v for k, v in item_to_supplier.items()}
+
+    index: Dict[str, str] = {}
+    for key in mapping:
+        for base in (key, f"{key}s", key[:-1]):
+            for form in (base, f"{base}s"):
+                norm = _normalize(form)
+                supplier = mapping.get(norm) or mapping.get(_alt_normalize(norm))
+                if supplier:
+                    index[form] = supplier
+    return index
 
 
 class KeywordMappingRetriever(BaseRetriever):
@@ -32,33 +73,14 @@ class KeywordMappingRetriever(BaseRetriever):
 
     def __init__(self, item_to_supplier: Dict[str, str]):
         super().__init__()
-        # Normalize keys to lowercase singular for lookup simplicity
-        self._mapping = {self._normalize(k): v for k, v in item_to_supplier.items()}
+        self._mapping = _build_index(item_to_supplier)
 
     def _get_relevant_documents(self, query: str) -> List[Document]:
-        key = self._normalize(query)
-        supplier = self._mapping.get(key)
-        if supplier:
-            return [Document(page_content=supplier, metadata={"item": query})]
-        # Fallback: try a naive plural->singular or singular->plural heuristic
-        alt_key = self._alt_normalize(key)
-        supplier = self._mapping.get(alt_key)
+        supplier = self._mapping.get(query.strip().lower())
         if supplier:
             return [Document(page_content=supplier, metadata={"item": query})]
         return []
 
-    def _normalize(self, text: str) -> str:
-        text = text.strip().lower()
-        if text.endswith("s") and not text.endswith("ss"):
-            return text[:-1]
-        return text
-
-    def _alt_normalize(self, text: str) -> str:
-        # Toggle simple plural form for a second chance match
-        if text.endswith("s") and not text.endswith("ss"):
-            return text[:-1]
-        return f"{text}s"
-
 
 class SupplierAgent:
     """Looks up a preferred supplier for a given item via a simple retriever.
@@ -71,18 +93,26 @@ class SupplierAgent:
 
     def __init__(self, item_to_supplier: Optional[Dict[str, str]] = None) -> None:
         self.item_to_supplier: Dict[str, str] = item_to_supplier or {}
+        # The retriever is kept for chain composition; lookups go straight to
+        # the precomputed index to skip the Runnable/Document round trip.
         self.retriever = KeywordMappingRetriever(self.item_to_supplier)
-        self.runnable = RunnableLambda(self._lookup_to_dict)
+        self._mapping = self.retriever._mapping
+
+    @cached_property
+    def runnable(self) -> RunnableLambda:
+        """Lookup function wrapped as a LangChain Runnable, built on first access."""
+        from langchain_core.runnables import RunnableLambda
+
+        return RunnableLambda(self._lookup_to_dict)
 
     def get_supplier(self, item: str) -> Dict[str, str]:
         return self._lookup_to_dict(item)
 
     def _lookup_to_dict(self, item: str) -> Dict[str, str]:
-        # In newer LangChain versions, retrievers are Runnables.
-        # Use `invoke` instead of `get_relevant_documents`.
-        docs = self.retriever.invoke(item)
-        supplier = docs[0].page_content if docs else "Unknown Supplier"
-        return {"item": item, "supplier": supplier}
+        return {"item": item, "supplier": self._resolve_supplier(item)}
+
+    def _resolve_supplier(self, item: str) -> str:
+        return self._mapping.get(item.strip().lower(), "Unknown Supplier")
 
 
 __all__ = ["SupplierAgent", "KeywordMappingRetriever"]
@@ -18,86 +18,95 @@ You can modify the example requests in `examples/test_requests.txt`.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, TypedDict
-
-from langgraph.graph import END, START, StateGraph
+import operator
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Annotated, Dict, List, Optional
 
 from agents.intake_agent import IntakeAgent
 from agents.supplier_agent import SupplierAgent
 from agents.approval_agent import ApprovalAgent
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+    from langgraph.graph.state import CompiledStateGraph
+
 
-class WorkflowState(TypedDict, total=False):
+@dataclass(slots=True)
+class WorkflowState:
     """State passed between graph nodes.
 
-    Keys:
+    Fields are pre-declared with defaults, so nodes read them as plain
+    attributes and return only the fields they update.
+
+    Fields:
         original_request: Original natural language input
         item: Parsed item noun
         quantity: Parsed integer quantity
         supplier: Preferred supplier name
         approved: Boolean approval decision
         reason: Human-readable reason for the decision
-        logs: A list of textual log entries for traceability
+        logs: A list of textual log entries for traceability; nodes return
+            only their new entries and LangGraph appends them
     """
 
-    original_request: str
-    item: str
-    quantity: int
-    supplier: str
-    approved: bool
-    reason: str
-    logs: List[str]
+    original_request: str = ""
+    item: str = ""
+    quantity: int = 1
+    supplier: str = ""
+    approved: bool = False
+    reason: str = ""
+    logs: Annotated[List[str], operator.add] = field(default_factory=list)
+
+
+# Agents are stateless between requests, so a single instance of each is
+# shared by every graph built in this module.
+ITEM_TO_SUPPLIER: Dict[str, str] = {
+    "laptop": "Acme Computers",
+    "monitor": "Display World",
+    "mouse": "Pointer Pros",
+    "keyboard": "KeyCo",
+    "chair": "OfficeCo",
+    "desk": "FurnishIt",
+}
+
+intake_agent = IntakeAgent()
+supplier_agent = SupplierAgent(item_to_supplier=ITEM_TO_SUPPLIER)
+approval_agent = ApprovalAgent(max_auto_approve_quantity=5)
+
+# Compiled graph, built lazily on first use and reused across requests.
+_APP: Optional[CompiledStateGraph] = None
 
 
 def build_graph() -> StateGraph:
     """Construct the LangGraph state graph with three nodes and linear edges."""
 
-    graph = StateGraph(WorkflowState)
+    # LangGraph is heavy to import, so defer it until a graph is actually built.
+    from langgraph.graph import END, START, StateGraph
 
-    intake_agent = IntakeAgent()
-    supplier_agent = SupplierAgent(
-        item_to_supplier={
-            "laptop": "Acme Computers",
-            "monitor": "Display World",
-            "mouse": "Pointer Pros",
-            "keyboard": "KeyCo",
-            "chair": "OfficeCo",
-            "desk": "FurnishIt",
-        }
-    )
-    approval_agent = ApprovalAgent(max_auto_approve_quantity=5)
+    graph = StateGraph(WorkflowState)
 
-    def intake_node(state: WorkflowState) -> WorkflowState:
-        request = state["original_request"]
-        parsed = intake_agent.parse_request(request)
-        logs = state.get("logs", []) + [f"Intake parsed: {parsed}"]
+    # Nodes return only the keys they change; LangGraph merges them into state.
+    def intake_node(state: WorkflowState) -> Dict[str, object]:
+        parsed = intake_agent.parse_request(state.original_request)
         return {
-            **state,
             "item": parsed["item"],
             "quantity": int(parsed["quantity"]),
-            "logs": logs,
+            "logs": [f"Intake parsed: {parsed}"],
         }
 
-    def supplier_node(state: WorkflowState) -> WorkflowState:
-        item = state.get("item", "")
-        lookup = supplier_agent.get_supplier(item)
-        logs = state.get("logs", []) + [f"Supplier selected: {lookup}"]
+    def supplier_node(state: WorkflowState) -> Dict[str, object]:
+        lookup = supplier_agent.get_supplier(state.item)
         return {
-            **state,
             "supplier": lookup["supplier"],
-            "logs": logs,
+            "logs": [f"Supplier selected: {lookup}"],
         }
 
-    def approval_node(state: WorkflowState) -> WorkflowState:
-        quantity = int(state.get("quantity", 1))
-        decision = approval_agent.decide(quantity)
-        logs = state.get("logs", []) + [f"Approval decision: {decision}"]
+    def approval_node(state: WorkflowState) -> Dict[str, object]:
+        decision = approval_agent.decide(state.quantity)
         return {
-            **state,
             "approved": bool(decision["approved"]),
             "reason": str(decision["reason"]),
-            "logs": logs,
+            "logs": [f"Approval decision: {decision}"],
         }
 
     graph.add_node("intake", intake_node)
@@ -112,42 +121,70 @@ def build_graph() -> StateGraph:
     return graph
 
 
-def run_demo(request: str) -> Dict[str, object]:
-    """Execute the workflow for a single request and print the trace."""
+def _get_app() -> CompiledStateGraph:
+    """Return the compiled workflow, compiling it once on first call."""
+
+    global _APP
+    if _APP is None:
+        _APP = build_graph().compile()
+    return _APP
 
-    graph = build_graph()
-    app = graph.compile()
 
-    initial_state: WorkflowState = {
-        "original_request": request,
-        "logs": [f"Received request: {request}"],
-    }
+def _initial_state(request: str) -> WorkflowState:
+    return WorkflowState(
+        original_request=request,
+        logs=[f"Received request: {request}"],
+    )
 
-    final_state: WorkflowState = app.invoke(initial_state)
 
+def _print_trace(final_state: WorkflowState) -> None:
     print("\n=== Procurement Workflow Trace ===")
-    for entry in final_state.get("logs", []):
+    for entry in final_state.logs:
         print("-", entry)
     print("\n=== Final Outcome ===")
-    print(f"Item: {final_state.get('item')}")
-    print(f"Quantity: {final_state.get('quantity')}")
-    print(f"Supplier: {final_state.get('supplier')}")
-    print(f"Approved: {final_state.get('approved')}")
-    print(f"Reason: {final_state.get('reason')}")
+    print(f"Item: {final_state.item}")
+    print(f"Quantity: {final_state.quantity}")
+    print(f"Supplier: {final_state.supplier}")
+    print(f"Approved: {final_state.approved}")
+    print(f"Reason: {final_state.reason}")
+
+
+def run_demo(request: str) -> Dict[str, object]:
+    """Execute the workflow for a single request and print the trace."""
+
+    # The compiled graph returns the final state as a dict of field values.
+    final_state = WorkflowState(**_get_app().invoke(_initial_state(request)))
+    _print_trace(final_state)
+    return asdict(final_state)
+
+
+def run_batch(requests: List[str]) -> List[Dict[str, object]]:
+    """Execute the workflow for many requests concurrently and print each trace.
+
+    Requests run through `batch` on the compiled graph so node work can
+    overlap; traces are printed afterwards, in input order.
+    """
 
-    return dict(final_state)
+    final_states = [
+        WorkflowState(**values)
+        for values in _get_app().batch([_initial_state(request) for request in requests])
+    ]
+    for final_state in final_states:
+        _print_trace(final_state)
+    return [asdict(final_state) for final_state in final_states]
 
 
 def main() -> None:
     # Use at least one example from examples/test_requests.txt
     try:
         with open("examples/test_requests.txt", "r", encoding="utf-8") as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
+            # Iterate the file directly and strip each line only once.
+            lines = [line for line in (raw.strip() for raw in f) if line]
     except FileNotFoundError:
         lines = ["Order 3 laptops"]
 
-    for req in lines:  # Process all example requests
-        _ = run_demo(req)
+    # Process all example requests against the same compiled graph
+    _ = run_batch(lines)
 
 
 if __name__ == "__main__":